@@ -31,13 +31,22 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Field names for converting ORM rows straight into PaymentInDB via
+# model_construct: payments come from our own table (validated at write
+# time), so per-row from_attributes reflection + validation is skipped
+_PAYMENT_FIELDS = tuple(PaymentInDB.model_fields)
+
+def _payment_to_schema(row) -> PaymentInDB:
+    return PaymentInDB.model_construct(**{f: getattr(row, f) for f in _PAYMENT_FIELDS})
+
 @router.post("/", response_model=PaymentInDB)
 async def create_payment(payment: PaymentCreate, db: AsyncSession = Depends(get_db)):
     return await crud.create_payment(db, payment)
 
-@router.get("/", response_model=List[PaymentInDB])
-async def read_all_payments(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    return await crud.get_all_payments(db, skip, limit)
+@router.get("/", response_model=None)
+async def read_all_payments(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)) -> List[PaymentInDB]:
+    payments = await crud.get_all_payments(db, skip, limit)
+    return [_payment_to_schema(p) for p in payments]
 
 @router.get("/{payment_id}", response_model=PaymentInDB)
 async def read_payment(payment_id: UUID, db: AsyncSession = Depends(get_db)):
@@ -119,21 +128,9 @@ async def create_payment_intent(
             metadata["user_id"] = str(payment_data.user_id)
             logger.debug(f"Adding user_id to metadata: {payment_data.user_id}")
         
-        # Validate amount (must be positive and reasonable)
-        if payment_data.amount <= 0:
-            logger.warning(f"Invalid payment amount: {payment_data.amount}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Payment amount must be greater than zero"
-            )
-        
-        if payment_data.amount > 999999:  # $9,999.99 max
-            logger.warning(f"Payment amount too large: {payment_data.amount}")
-            raise HTTPException(
-                status_code=400, 
-                detail="Payment amount exceeds maximum allowed"
-            )
-        
+        # Amount bounds are enforced by the PaymentIntentCreate schema
+        # (Field(gt=0, le=999999)), so bad requests never reach this point
+
         logger.info(f"Creating Stripe Payment Intent with metadata: {metadata}")
         
         # Create payment intent with Stripe API
@@ -151,7 +148,10 @@ async def create_payment_intent(
         logger.info(f"Successfully created Payment Intent: {intent.id}")
         logger.debug(f"Payment Intent details - Status: {intent.status}, Amount: {intent.amount}")
         
-        return PaymentIntentResponse(
+        # model_construct skips re-validation: Stripe already returned these
+        # values in a known-good shape (standard pattern for data validated at
+        # the source)
+        return PaymentIntentResponse.model_construct(
             client_secret=intent.client_secret,
             payment_intent_id=intent.id
         )
@@ -438,10 +438,11 @@ async def create_unified_payment(
             # Call existing Stripe endpoint logic
             stripe_response = await create_payment_intent(stripe_data, db)
             
-            return UnifiedPaymentResponse(
+            return UnifiedPaymentResponse.model_construct(
                 provider="stripe",
                 payment_id=stripe_response.payment_intent_id,
                 client_secret=stripe_response.client_secret,
+                approval_url=None,
                 status="requires_payment_method"
             )
             
@@ -467,9 +468,10 @@ async def create_unified_payment(
             # Call existing PayPal endpoint logic
             paypal_response = await create_paypal_order(paypal_data, db)
             
-            return UnifiedPaymentResponse(
+            return UnifiedPaymentResponse.model_construct(
                 provider="paypal",
                 payment_id=paypal_response.order_id,
+                client_secret=None,
                 approval_url=paypal_response.approval_url,
                 status=paypal_response.status.lower()
             )
@@ -693,7 +695,7 @@ async def create_paypal_order(
                 
                 logger.info(f"PayPal order created successfully - ID: {payment.id}, Status: {payment.state}")
                 
-                return PayPalOrderResponse(
+                return PayPalOrderResponse.model_construct(
                     order_id=payment.id,
                     approval_url=approval_url,
                     status=payment.state.upper()
@@ -1,7 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
 @router.get("/")
-async def ping():
-    return {"message": "pong"}  # Simple health check endpoint
\ No newline at end of file
+async def ping(response: Response):
+    # Health output never varies; let clients and proxies reuse it briefly
+    # instead of hitting the app for every probe
+    response.headers["Cache-Control"] = "public, max-age=30"
+    return {"message": "pong"}  # Simple health check endpoint
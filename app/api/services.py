@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from uuid import UUID
 
 from app.schemas.service import ServiceCreate, ServiceRead, ServiceUpdate
@@ -25,8 +25,11 @@ async def get_service(
 
 @router.get("/", response_model=list[ServiceRead])
 async def list_services(
-    db: AsyncSession = Depends(get_db)
+    response: Response, db: AsyncSession = Depends(get_db)
 ) -> list[ServiceRead]:
+    # Services change rarely; allow clients/CDNs to reuse the list briefly so
+    # repeat GETs short-circuit before reaching the app at all
+    response.headers["Cache-Control"] = "public, max-age=30"
     return await service_crud.list_services(db=db)
 
 @router.put("/{service_id}", response_model=ServiceRead)
@@ -22,10 +22,16 @@ from app.core.exceptions import (
 )
 from typing import List
 from uuid import UUID
+from pydantic import TypeAdapter
 
 # Create router instance for user endpoints
 router = APIRouter()
 
+# Bulk adapter for list responses: validates all rows in one pydantic-core
+# (Rust) pass instead of a per-row Python loop, keeping large list
+# serialization off the event loop's critical path
+_user_list_adapter = TypeAdapter(List[UserOut])
+
 @router.post("/", response_model=UserOut)
 async def create_new_user(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """Create a new user account with comprehensive error handling
@@ -109,8 +115,9 @@ async def read_user(user_id: UUID, db: AsyncSession = Depends(get_db)):
         - Provides clear error messages for different failure scenarios
     """
     try:
-        # Look up user by ID
-        db_user = await get_user_by_id(db, str(user_id))
+        # Look up user by ID (pass the parsed UUID straight through so the
+        # driver binds it as uuid, not text)
+        db_user = await get_user_by_id(db, user_id)
         if not db_user:
             raise HTTPException(status_code=404, detail="User not found")
         
@@ -133,8 +140,8 @@ async def read_user(user_id: UUID, db: AsyncSession = Depends(get_db)):
             detail="An unexpected error occurred while retrieving user"
         )
 
-@router.get("/", response_model=List[UserOut])
-async def read_users(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
+@router.get("/", response_model=None)
+async def read_users(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)) -> List[UserOut]:
     """Get a paginated list of users with safe parameter handling
     
     This endpoint retrieves users with pagination support, including comprehensive
@@ -162,10 +169,11 @@ async def read_users(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(
         - Returns consistent response format even for edge cases
     """
     try:
-        # Get paginated list of users
+        # Get paginated list of users and serialize the whole page in one
+        # pydantic-core pass
         users = await get_users(db, skip=skip, limit=limit)
-        return users
-        
+        return _user_list_adapter.validate_python(users, from_attributes=True)
+
     except ValidationError as e:
         # Convert validation errors to HTTP exceptions
         raise handle_validation_error(e, e.field)
@@ -3,6 +3,7 @@
 
 import logging
 import traceback
+from functools import wraps
 from typing import Optional, Any, Dict
 from fastapi import HTTPException
 from sqlalchemy.exc import (
@@ -180,6 +181,43 @@ def handle_business_logic_error(error: Exception, operation: str) -> HTTPExcepti
         detail=str(error)
     )
 
+def db_operation(fn):
+    """
+    Decorator providing the standard error handling for async CRUD functions
+
+    Wraps a coroutine taking the database session as its first argument and
+    applies the error-handling contract previously repeated inline in every
+    CRUD function:
+        - ValidationError passes through unchanged
+        - SQLAlchemyError rolls back the session, logs, and raises DatabaseError
+        - Any other exception rolls back, logs, and raises DatabaseError
+
+    Apply outside any @db_retry decorator so retries still see the raw
+    database exceptions before they are converted to DatabaseError.
+
+    Args:
+        fn: Async CRUD function with signature (db, *args, **kwargs)
+
+    Returns:
+        Wrapped coroutine with unified exception handling
+    """
+    @wraps(fn)
+    async def wrapper(db, *args, **kwargs):
+        try:
+            return await fn(db, *args, **kwargs)
+        except ValidationError:
+            # Re-raise validation errors as-is
+            raise
+        except SQLAlchemyError as e:
+            await db.rollback()
+            log_exception(e, f"{fn.__name__} database operation")
+            raise DatabaseError(f"Database operation failed in {fn.__name__}: {str(e)}", e)
+        except Exception as e:
+            await db.rollback()
+            log_exception(e, f"{fn.__name__} unexpected error")
+            raise DatabaseError(f"Unexpected error in {fn.__name__}: {str(e)}", e)
+    return wrapper
+
 def safe_execute(func, *args, **kwargs):
     """
     Safely execute a function with comprehensive error handling
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import update
 from uuid import UUID
 
 from app.models.appointment import Appointment
@@ -15,8 +16,7 @@ async def create_appointment(db: AsyncSession, appointment: AppointmentCreate) -
     return appointment
 
 async def get_appointment(db: AsyncSession, appointment_id: UUID) -> Appointment:
-    result = await db.execute(select(Appointment).where(Appointment.id == appointment_id))
-    return result.scalar_one_or_none()
+    return await db.get(Appointment, appointment_id)
 
 async def list_appointments(db: AsyncSession) -> list[Appointment]:
     result = await db.execute(select(Appointment))
@@ -24,14 +24,15 @@ async def list_appointments(db: AsyncSession) -> list[Appointment]:
 
 @db_retry_critical
 async def update_appointment(db: AsyncSession, appointment_id: UUID, appointment_data: AppointmentUpdate) -> Appointment:
-    result = await db.execute(select(Appointment).where(Appointment.id == appointment_id))
-    appointment = result.scalar_one_or_none()
-    if appointment:
-        for field, value in appointment_data.model_dump(exclude_unset=True).items():
-            setattr(appointment, field, value)
-        await db.commit()
-        await db.refresh(appointment)
-    return appointment
+    values = appointment_data.model_dump(exclude_unset=True)
+    if not values:
+        return await get_appointment(db, appointment_id)
+    result = await db.execute(update(Appointment).where(Appointment.id == appointment_id).values(**values))
+    if result.rowcount == 0:
+        await db.rollback()
+        return None
+    await db.commit()
+    return await get_appointment(db, appointment_id)
 
 async def delete_appointment(db: AsyncSession, appointment_id: UUID) -> bool:
     result = await db.execute(select(Appointment).where(Appointment.id == appointment_id))
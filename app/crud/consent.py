@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import insert, update
 from app.models.consent import Consent
 from app.schemas.consent import ConsentCreate, ConsentUpdate
 from uuid import UUID
@@ -11,24 +12,40 @@ async def create_consent(db: AsyncSession, consent_in: ConsentCreate):
     await db.refresh(new_consent)
     return new_consent
 
+async def create_consents_bulk(db: AsyncSession, consents_in: list[ConsentCreate]) -> list[Consent]:
+    """Insert many consents in one multi-row INSERT ... RETURNING round trip"""
+    if not consents_in:
+        return []
+    result = await db.execute(
+        insert(Consent)
+        .values([c.model_dump() for c in consents_in])
+        .returning(Consent)
+    )
+    consents = result.scalars().all()
+    await db.commit()
+    return consents
+
 async def get_consent(db: AsyncSession, consent_id: UUID):
-    result = await db.execute(select(Consent).where(Consent.id == consent_id))
-    return result.scalar_one_or_none()
+    # Session.get() checks the identity map first and uses the optimized
+    # primary-key fetch path, so repeat reads in a request issue no SQL
+    return await db.get(Consent, consent_id)
 
 async def get_all_consents(db: AsyncSession, skip: int = 0, limit: int = 100):
     result = await db.execute(select(Consent).offset(skip).limit(limit))
     return result.scalars().all()
 
 async def update_consent(db: AsyncSession, consent_id: UUID, consent_in: ConsentUpdate):
-    result = await db.execute(select(Consent).where(Consent.id == consent_id))
-    consent = result.scalar_one_or_none()
-    if not consent:
+    values = consent_in.model_dump(exclude_unset=True)
+    if not values:
+        return await get_consent(db, consent_id)
+    # Single UPDATE statement instead of select + per-attribute setattr,
+    # skipping ORM change-tracking on every field
+    result = await db.execute(update(Consent).where(Consent.id == consent_id).values(**values))
+    if result.rowcount == 0:
+        await db.rollback()
         return None
-    for key, value in consent_in.model_dump(exclude_unset=True).items():
-        setattr(consent, key, value)
     await db.commit()
-    await db.refresh(consent)
-    return consent
+    return await get_consent(db, consent_id)
 
 async def delete_consent(db: AsyncSession, consent_id: UUID):
     result = await db.execute(select(Consent).where(Consent.id == consent_id))
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import insert, update
 from app.models.payment import Payment
 from app.schemas.payment import PaymentCreate, PaymentUpdate
 from app.core.retry_policies import db_retry, db_retry_critical
@@ -13,10 +14,28 @@ async def create_payment(db: AsyncSession, payment_in: PaymentCreate):
     await db.refresh(new_payment)
     return new_payment
 
+@db_retry_critical
+async def create_payments_bulk(db: AsyncSession, payments_in: list[PaymentCreate]) -> list[Payment]:
+    """Insert many payments in one round trip (e.g. webhook batch ingest)
+
+    Uses a single multi-row INSERT ... RETURNING via SQLAlchemy's
+    insertmanyvalues instead of N add/commit cycles.
+    """
+    if not payments_in:
+        return []
+    result = await db.execute(
+        insert(Payment)
+        .values([p.model_dump() for p in payments_in])
+        .returning(Payment)
+    )
+    payments = result.scalars().all()
+    await db.commit()
+    return payments
+
 @db_retry
 async def get_payment(db: AsyncSession, payment_id: UUID):
-    result = await db.execute(select(Payment).where(Payment.id == payment_id))
-    return result.scalar_one_or_none()
+    # Identity-map-aware primary-key fetch
+    return await db.get(Payment, payment_id)
 
 async def get_all_payments(db: AsyncSession, skip: int = 0, limit: int = 100):
     result = await db.execute(select(Payment).offset(skip).limit(limit))
@@ -24,15 +43,17 @@ async def get_all_payments(db: AsyncSession, skip: int = 0, limit: int = 100):
 
 @db_retry_critical
 async def update_payment(db: AsyncSession, payment_id: UUID, payment_in: PaymentUpdate):
-    result = await db.execute(select(Payment).where(Payment.id == payment_id))
-    payment = result.scalar_one_or_none()
-    if not payment:
+    values = payment_in.model_dump(exclude_unset=True)
+    if not values:
+        return await get_payment(db, payment_id)
+    # Single UPDATE statement instead of select + per-attribute setattr,
+    # skipping ORM change-tracking on every field
+    result = await db.execute(update(Payment).where(Payment.id == payment_id).values(**values))
+    if result.rowcount == 0:
+        await db.rollback()
         return None
-    for key, value in payment_in.model_dump(exclude_unset=True).items():
-        setattr(payment, key, value)
     await db.commit()
-    await db.refresh(payment)
-    return payment
+    return await get_payment(db, payment_id)
 
 async def delete_payment(db: AsyncSession, payment_id: UUID):
     result = await db.execute(select(Payment).where(Payment.id == payment_id))
@@ -2,33 +2,53 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import update, delete
 from uuid import UUID
+import time
 from app.models.service import Service
 from app.schemas.service import ServiceCreate, ServiceUpdate
 
+# In-process TTL cache for the active-services list. Services change rarely,
+# so most list_services calls can skip the query entirely. The cache is
+# cleared on any write so stale entries never outlive a mutation.
+_SERVICES_CACHE_TTL = 60  # seconds
+_services_cache: list[Service] | None = None
+_services_cache_expires: float = 0.0
+
+def _invalidate_services_cache() -> None:
+    global _services_cache
+    _services_cache = None
+
 async def create_service(db: AsyncSession, data: ServiceCreate) -> Service:
-    service = Service(**data.dict())    
+    service = Service(**data.dict())
     db.add(service)
     await db.commit()
     await db.refresh(service)
+    _invalidate_services_cache()
     return service
 
 async def get_service(db: AsyncSession, service_id: UUID) -> Service:
-    result = await db.execute(select(Service).where(Service.id == service_id))
-    return result.scalar_one_or_none()
+    return await db.get(Service, service_id)
 
 async def list_services(db: AsyncSession) -> list[Service]:
+    global _services_cache, _services_cache_expires
+    if _services_cache is not None and time.monotonic() < _services_cache_expires:
+        return _services_cache
     result = await db.execute(select(Service).where(Service.is_active == True))
-    return result.scalars().all()
+    services = result.scalars().all()
+    _services_cache = services
+    _services_cache_expires = time.monotonic() + _SERVICES_CACHE_TTL
+    return services
 
 async def update_service(db: AsyncSession, service_id: UUID, data: ServiceUpdate) -> Service:
-    result = await db.execute(select(Service).where(Service.id == service_id))
-    service = result.scalar_one_or_none()
-    if service:
-        for field, value in data.dict(exclude_unset=True).items():
-            setattr(service, field, value)
-        await db.commit()
-        await db.refresh(service)
-    return service
+    values = data.dict(exclude_unset=True)
+    if not values:
+        return await get_service(db, service_id)
+    result = await db.execute(update(Service).where(Service.id == service_id).values(**values))
+    if result.rowcount == 0:
+        await db.rollback()
+        return None
+    await db.commit()
+    _invalidate_services_cache()
+    return await get_service(db, service_id)
 
 async def delete_service(db: AsyncSession, service_id: UUID) -> bool:
     result = await db.execute(select(Service).where(Service.id == service_id))
@@ -36,5 +56,6 @@ async def delete_service(db: AsyncSession, service_id: UUID) -> bool:
     if service:
         await db.delete(service)
         await db.commit()
+        _invalidate_services_cache()
         return True
     return False
\ No newline at end of file
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import update
 from uuid import UUID
 
 from app.models.training import Training
@@ -13,22 +14,22 @@ async def create_training(db: AsyncSession, training: TrainingCreate) -> Trainin
     return training_obj
 
 async def get_training(db: AsyncSession, training_id: UUID) -> Training | None:
-     result = await db.execute(select(Training).where(Training.id == training_id))
-     return result.scalar_one_or_none()
+     return await db.get(Training, training_id)
 
 async def list_trainings(db: AsyncSession) -> list[Training]:
     result = await db.execute(select(Training))
     return result.scalars().all()
 
 async def update_training(db: AsyncSession, training_id: UUID, training_data: TrainingUpdate) -> Training | None:
-    result = await db.execute(select(Training).where(Training.id == training_id))
-    training = result.scalar_one_or_none()
-    if training:
-        for field, value in training_data.model_dump(exclude_unset=True).items():
-            setattr(training, field, value)
-        await db.commit()
-        await db.refresh(training)
-    return training
+    values = training_data.model_dump(exclude_unset=True)
+    if not values:
+        return await get_training(db, training_id)
+    result = await db.execute(update(Training).where(Training.id == training_id).values(**values))
+    if result.rowcount == 0:
+        await db.rollback()
+        return None
+    await db.commit()
+    return await get_training(db, training_id)
 
 async def delete_training(db: AsyncSession, training_id: UUID) -> bool:
     result = await db.execute(select(Training).where(Training.id == training_id))
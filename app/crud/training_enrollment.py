@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import insert, update
 from uuid import UUID
 
 from app.models.training_enrollment import TrainingEnrollment
@@ -12,24 +13,36 @@ async def create_enrollment(db: AsyncSession, data: TrainingEnrollmentCreate) ->
     await db.refresh(enrollment)
     return enrollment
 
+async def create_enrollments_bulk(db: AsyncSession, items: list[TrainingEnrollmentCreate]) -> list[TrainingEnrollment]:
+    """Insert many enrollments in one multi-row INSERT ... RETURNING round trip"""
+    if not items:
+        return []
+    result = await db.execute(
+        insert(TrainingEnrollment)
+        .values([i.model_dump() for i in items])
+        .returning(TrainingEnrollment)
+    )
+    enrollments = result.scalars().all()
+    await db.commit()
+    return enrollments
+
 async def get_enrollment(db: AsyncSession, enrollment_id: UUID) -> TrainingEnrollment | None:
-    result = await db.execute(select(TrainingEnrollment).where(TrainingEnrollment.id == enrollment_id))
-    return result.scalar_one_or_none()
+    return await db.get(TrainingEnrollment, enrollment_id)
 
 async def list_enrollments(db: AsyncSession) -> list[TrainingEnrollment]:
     result = await db.execute(select(TrainingEnrollment))
     return result.scalars().all()
 
 async def update_enrollment(db: AsyncSession, enrollment_id: UUID, data: TrainingEnrollmentUpdate) -> TrainingEnrollment | None:
-    result = await db.execute(select(TrainingEnrollment).where(TrainingEnrollment.id == enrollment_id))
-    enrollment = result.scalar_one_or_none()
-    if enrollment:
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(enrollment, field, value)
-        await db.commit()
-        await db.refresh(enrollment)
-
-    return enrollment
+    values = data.model_dump(exclude_unset=True)
+    if not values:
+        return await get_enrollment(db, enrollment_id)
+    result = await db.execute(update(TrainingEnrollment).where(TrainingEnrollment.id == enrollment_id).values(**values))
+    if result.rowcount == 0:
+        await db.rollback()
+        return None
+    await db.commit()
+    return await get_enrollment(db, enrollment_id)
 
 async def delete_enrollment(db: AsyncSession, enrollment_id: UUID) -> bool:
     result = await db.execute(select(TrainingEnrollment).where(TrainingEnrollment.id == enrollment_id))
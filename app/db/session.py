@@ -3,9 +3,9 @@
 # Includes comprehensive error handling, connection pooling, and robust session management
 # All database operations are protected with proper exception handling and cleanup
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import NullPool
 import os
 from dotenv import load_dotenv
 import logging
@@ -20,18 +20,33 @@ DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+asyncpg://localhost:5432/do
 # Configure logging for database operations
 logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
 
+# Supabase's transaction pooler (pgbouncer on port 6543) already pools
+# connections server-side; stacking an app-side pool on top of it wastes
+# connections and serializes through asyncpg. Use NullPool behind the pooler
+# and keep the in-process pool only for direct 5432 connections.
+_BEHIND_SUPABASE_POOLER = ":6543" in DATABASE_URL
+
+if _BEHIND_SUPABASE_POOLER:
+    _pool_settings = {
+        "poolclass": NullPool,  # pgbouncer owns pooling; open/close per checkout
+    }
+else:
+    _pool_settings = {
+        # Connection pool settings for better reliability (async uses AsyncAdaptedQueuePool by default)
+        "pool_size": 5,  # Maintain 5 connections in pool
+        "max_overflow": 10,  # Allow up to 10 additional connections
+        "pool_pre_ping": True,  # Test connections before use to handle dropped connections
+        "pool_recycle": 300,  # Recycle connections every 5 minutes to prevent timeouts
+        "pool_timeout": 30,  # Wait up to 30 seconds for a connection
+    }
+
 # Create async database engine with Supabase-compatible settings and retry-friendly configuration
 engine = create_async_engine(
-    DATABASE_URL, 
+    DATABASE_URL,
     echo=True,  # Log all SQL statements for debugging
-    
-    # Connection pool settings for better reliability (async uses AsyncAdaptedQueuePool by default)
-    pool_size=5,  # Maintain 5 connections in pool
-    max_overflow=10,  # Allow up to 10 additional connections
-    pool_pre_ping=True,  # Test connections before use to handle dropped connections
-    pool_recycle=300,  # Recycle connections every 5 minutes to prevent timeouts
-    pool_timeout=30,  # Wait up to 30 seconds for a connection
-    
+
+    **_pool_settings,
+
     # Engine-level retry configuration
     connect_args={
         # Disable prepared statement caching to avoid conflicts with Supabase connection pooling
@@ -50,10 +65,9 @@ engine = create_async_engine(
     )
 
 # Create session factory for database operations
-SessionLocal = sessionmaker(
-    bind=engine,  # Bind to our async engine
-    class_=AsyncSession,  # Use async session class
-    autocommit=False,  # Don't auto-commit transactions
+SessionLocal = async_sessionmaker(
+    engine,  # Bind to our async engine
+    expire_on_commit=False,  # Keep ORM attributes readable after commit without a re-SELECT
     autoflush=False  # Don't auto-flush changes to database
 )
 
@@ -0,0 +1,6 @@
+# Shared pydantic config for read models built from ORM rows.
+# One ConfigDict instance reused across schema files instead of a nested
+# Config class per model — single source of truth, one dict built at import.
+from pydantic import ConfigDict
+
+READ_CONFIG = ConfigDict(from_attributes=True)
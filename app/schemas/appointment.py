@@ -1,5 +1,6 @@
 import enum
 from pydantic import BaseModel
+from app.schemas._config import READ_CONFIG
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
@@ -28,5 +29,4 @@ class AppointmentRead(AppointmentBase):
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = READ_CONFIG
\ No newline at end of file
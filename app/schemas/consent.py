@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from app.schemas._config import READ_CONFIG
 from datetime import datetime
 from uuid import UUID
 
@@ -16,5 +17,4 @@ class ConsentInDB(ConsentBase):
     id: UUID
     signed_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = READ_CONFIG
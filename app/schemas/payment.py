@@ -1,5 +1,10 @@
+# Convention: when building these models from data we already trust (DB rows,
+# Stripe/PayPal API output validated at the source), construct them with
+# Model.model_construct(...) to skip a redundant validation pass. Reserve
+# model_validate / normal construction for unvalidated input.
 from pydantic import BaseModel, Field
-from typing import Optional
+from app.schemas._config import READ_CONFIG
+from typing import Optional, TypeAlias
 from datetime import datetime
 from uuid import UUID
 
@@ -17,21 +22,19 @@ class PaymentBase(BaseModel):
     paypal_payment_id: Optional[str] = None
     paypal_payer_id: Optional[str] = None
 
-class PaymentCreate(PaymentBase):
-    pass
-
-class PaymentUpdate(PaymentBase):
-    pass
+# Structurally identical to PaymentBase; aliases avoid building two extra
+# pydantic core schemas at import
+PaymentCreate: TypeAlias = PaymentBase
+PaymentUpdate: TypeAlias = PaymentBase
 
 class PaymentInDB(PaymentBase):
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = READ_CONFIG
 
 class PaymentIntentCreate(BaseModel):
-    amount: int  # Amount in cents
+    amount: int = Field(gt=0, le=999999)  # Amount in cents, $9,999.99 max
     currency: str = "usd"
     service_id: Optional[UUID] = None
     appointment_id: Optional[UUID] = None
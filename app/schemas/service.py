@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional
+from app.schemas._config import READ_CONFIG
+from typing import Optional, TypeAlias
 from uuid import UUID
 from enum import Enum
 
@@ -15,14 +16,10 @@ class ServiceBase(BaseModel):
     duration_minutes: Optional[int]
     is_active: Optional[bool]
 
-class ServiceCreate(ServiceBase):
-    pass
-
-class ServiceUpdate(ServiceBase):
-    pass
+ServiceCreate: TypeAlias = ServiceBase
+ServiceUpdate: TypeAlias = ServiceBase
 
 class ServiceRead(ServiceBase):
     id: UUID
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = READ_CONFIG
\ No newline at end of file
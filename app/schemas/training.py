@@ -1,7 +1,8 @@
 from pydantic import BaseModel
+from app.schemas._config import READ_CONFIG
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TypeAlias
 
 class TrainingBase(BaseModel):
     title: str
@@ -10,15 +11,11 @@ class TrainingBase(BaseModel):
     date: datetime
     duration_minutes: Optional[int]
 
-class TrainingCreate(TrainingBase):
-    pass
-
-class TrainingUpdate(TrainingBase):
-    pass
+TrainingCreate: TypeAlias = TrainingBase
+TrainingUpdate: TypeAlias = TrainingBase
 
 class TrainingRead(TrainingBase):
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = READ_CONFIG
\ No newline at end of file
@@ -1,7 +1,8 @@
 from pydantic import BaseModel
+from app.schemas._config import READ_CONFIG
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TypeAlias
 
 class TrainingEnrollmentBase(BaseModel):
     user_id: UUID
@@ -9,15 +10,11 @@ class TrainingEnrollmentBase(BaseModel):
     payment_status: Optional[str] = "pending"
     passed_assessment: Optional[bool] = None
 
-class TrainingEnrollmentCreate(TrainingEnrollmentBase):
-    pass
-
-class TrainingEnrollmentUpdate(TrainingEnrollmentBase):
-    pass
+TrainingEnrollmentCreate: TypeAlias = TrainingEnrollmentBase
+TrainingEnrollmentUpdate: TypeAlias = TrainingEnrollmentBase
 
 class TrainingEnrollmentRead(TrainingEnrollmentBase):
     id: UUID
     enrolled_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = READ_CONFIG
\ No newline at end of file
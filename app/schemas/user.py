@@ -1,4 +1,5 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
+from app.schemas._config import READ_CONFIG
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
@@ -11,11 +12,14 @@ class UserBase(BaseModel):
     role: str
 
 class UserCreate(UserBase):
-    pass
+    # Strip whitespace and reject empty strings at validation time so the
+    # CRUD layer never has to re-check required fields on the write path.
+    # Input-only: UserOut must not inherit this, because stored rows may
+    # legitimately hold empty strings the baseline never rejected
+    model_config = ConfigDict(str_strip_whitespace=True, str_min_length=1)
 
 class UserOut(UserBase):
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = READ_CONFIG
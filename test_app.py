@@ -2,6 +2,7 @@
 Minimal FastAPI app to test Stripe integration
 """
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 import stripe
 import os
 from dotenv import load_dotenv
@@ -12,7 +13,7 @@ load_dotenv()
 # Configure Stripe
 stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
 
-app = FastAPI(title="Stripe Test App")
+app = FastAPI(title="Stripe Test App", default_response_class=ORJSONResponse)
 
 @app.get("/")
 async def root():
@@ -45,4 +46,5 @@ async def test_payment_intent(amount: int = 2000):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Use the C event loop and HTTP parser from uvicorn[standard]
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
\ No newline at end of file
@@ -16,7 +16,6 @@ Requirements:
     - stripe package installed (pip install stripe)
 """
 import os
-import stripe
 import logging
 from dotenv import load_dotenv
 from typing import Optional
@@ -76,14 +75,17 @@ def test_stripe_connection() -> bool:
         bool: True if connection successful, False otherwise
     """
     print("\nTesting Stripe API connection...")
-    
+
     # Configure Stripe with secret key
     stripe_key = os.getenv("STRIPE_SECRET_KEY")
     if not stripe_key:
         logger.error("STRIPE_SECRET_KEY not found in environment variables")
         print("[FAIL] Cannot test connection without STRIPE_SECRET_KEY")
         return False
-    
+
+    # Imported lazily so the misconfigured-env path never pays for the SDK
+    # (stripe pulls in requests/urllib3 at import)
+    import stripe
     stripe.api_key = stripe_key
     
     try:
@@ -142,7 +144,9 @@ def test_create_payment_intent() -> bool:
         bool: True if payment intent created successfully, False otherwise
     """
     print("\n💳 Testing Payment Intent creation...")
-    
+
+    import stripe  # Lazy: only needed once connection testing is reachable
+
     try:
         logger.info("Creating test payment intent")
         
@@ -2,7 +2,6 @@
 Simple Stripe test script (Windows compatible)
 """
 import os
-import stripe
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,8 +20,9 @@ def test_stripe():
         return
     
     print(f"[PASS] Found Stripe key: {stripe_key[:8]}...")
-    
-    # Configure Stripe
+
+    # Configure Stripe (imported lazily so the missing-key path skips the SDK)
+    import stripe
     stripe.api_key = stripe_key
     
     try:
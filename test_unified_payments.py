@@ -52,20 +52,13 @@ def test_paypal_connection():
             "client_secret": client_secret
         })
         
-        # Test by creating a minimal payment object (not executed)
-        test_payment = paypalrestsdk.Payment({
-            "intent": "sale",
-            "payer": {"payment_method": "paypal"},
-            "redirect_urls": {
-                "return_url": "http://test.com/return",
-                "cancel_url": "http://test.com/cancel"
-            },
-            "transactions": [{
-                "amount": {"total": "1.00", "currency": "USD"},
-                "description": "Test payment"
-            }]
-        })
-        
+        # One call to the token endpoint proves the credentials work —
+        # no need to build (or send) a test payment for this
+        access_token = paypalrestsdk.api.default().get_access_token()
+        if not access_token:
+            print("   [FAIL] PayPal did not return an access token")
+            return False
+
         print(f"   [PASS] PayPal configured successfully")
         print(f"          Mode: {os.getenv('PAYPAL_MODE', 'sandbox')}")
         print(f"          Client ID: {client_id[:8]}...")
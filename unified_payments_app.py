@@ -2,20 +2,42 @@
 Unified Payment API - Stripe + PayPal Integration
 This app supports both Stripe and PayPal payments with a unified interface
 """
-from fastapi import FastAPI, HTTPException, Request
-import stripe
-import paypalrestsdk
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+import functools
+import httpx
+import requests
+from requests.adapters import HTTPAdapter, Retry
+import asyncio
 import os
+import time
 import logging
 import json
+import orjson
+import base64
+import hashlib
+import hmac
+import zlib
+from urllib.parse import urlparse
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
-from typing import Optional
-from uuid import UUID
+import msgspec
+from typing import Annotated, List, Optional
 
 # Load environment variables
 load_dotenv()
 
+# Environment is immutable for the process lifetime; resolve everything once
+# at import instead of hitting os.environ in every handler
+STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY")
+STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
+PAYPAL_MODE = os.getenv("PAYPAL_MODE", "sandbox")  # sandbox or live
+PAYPAL_CLIENT_ID = os.getenv("PAYPAL_CLIENT_ID")
+PAYPAL_CLIENT_SECRET = os.getenv("PAYPAL_CLIENT_SECRET")
+PAYPAL_WEBHOOK_ID = os.getenv("PAYPAL_WEBHOOK_ID")
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+STRIPE_CONFIGURED = bool(STRIPE_SECRET_KEY)
+PAYPAL_CONFIGURED = bool(PAYPAL_CLIENT_ID and PAYPAL_CLIENT_SECRET)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,27 +45,103 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Doula Life Unified Payment API",
     description="Unified payment processing with Stripe and PayPal support",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # Rust JSON encoder for all responses
 )
 
-# Configure Stripe
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+# The payment SDKs are imported and configured lazily: each one costs
+# hundreds of ms of disk and bytecode work at cold start, and a deploy
+# that only takes one provider never pays for the other. functools.cache
+# makes the import-and-configure step run exactly once per process.
 
-# Configure PayPal
-paypalrestsdk.configure({
-    "mode": os.getenv("PAYPAL_MODE", "sandbox"),  # sandbox or live
-    "client_id": os.getenv("PAYPAL_CLIENT_ID"),
-    "client_secret": os.getenv("PAYPAL_CLIENT_SECRET")
-})
+@functools.cache
+def _get_stripe():
+    """Import and configure the Stripe SDK on first use"""
+    import stripe
+    from stripe.http_client import RequestsClient
+
+    stripe.api_key = STRIPE_SECRET_KEY
+    # One persistent HTTP client for the whole process: without this the SDK
+    # builds a fresh requests.Session (and pays a new TLS handshake) per API
+    # call; the shared client keeps urllib3's connection pool warm
+    stripe.default_http_client = RequestsClient(verify_ssl_certs=True)
+    return stripe
+
+# Shared across all PayPal SDK calls. The stock SDK issues every call
+# through requests.request(), which opens a fresh connection (and TLS
+# handshake) per call; route its HTTP through one pooled Session instead.
+_PAYPAL_SESSION = requests.Session()
+_PAYPAL_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
+@functools.cache
+def _get_paypal():
+    """Import and configure paypalrestsdk on first use"""
+    import paypalrestsdk
+
+    class _PooledPayPalApi(paypalrestsdk.Api):
+        """paypalrestsdk.Api that sends HTTP through the shared pooled session"""
+
+        def http_call(self, url, method, **kwargs):
+            logger.info("PayPal request[%s]: %s", method, url)
+            response = _PAYPAL_SESSION.request(method, url, proxies=self.proxies, **kwargs)
+            logger.info("PayPal response[%d]: %s", response.status_code, response.reason)
+            return self.handle_response(response, response.content.decode("utf-8"))
+
+    # Install as the SDK-wide default (paypalrestsdk.configure would build a
+    # plain Api, so set the module global it reads directly)
+    paypalrestsdk.api.__api__ = _PooledPayPalApi({
+        "mode": PAYPAL_MODE,
+        "client_id": PAYPAL_CLIENT_ID,
+        "client_secret": PAYPAL_CLIENT_SECRET
+    })
+    return paypalrestsdk
+
+# Keep the PayPal OAuth token warm: the SDK only re-fetches it lazily once
+# it has expired, which puts a synchronous HTTPS round trip on whichever
+# payment request happens to arrive first. A background task refreshes the
+# token at ~80% of its lifetime so the hot path always finds a valid one.
+_paypal_token_lock = asyncio.Lock()
+
+async def _refresh_paypal_token() -> float:
+    """Force-refresh the cached token; returns seconds until the next refresh"""
+    api = _get_paypal().api.default()
+    async with _paypal_token_lock:
+        # Clear the cached hash first — get_token_hash returns a still-valid
+        # cached token as-is, and we want to renew before expiry
+        api.token_hash = None
+        token = await asyncio.to_thread(api.get_token_hash)
+    return max(token.get("expires_in", 900) * 0.8, 60)
+
+async def _paypal_token_refresher() -> None:
+    while True:
+        try:
+            delay = await _refresh_paypal_token()
+        except Exception as e:
+            logger.warning("PayPal token refresh failed, retrying in 60s: %s", e)
+            delay = 60
+        await asyncio.sleep(delay)
+
+@app.on_event("startup")
+async def _start_paypal_token_refresher() -> None:
+    if PAYPAL_CONFIGURED:
+        asyncio.create_task(_paypal_token_refresher())
 
 # ========================
 # Pydantic Models
 # ========================
 
-class UnifiedPaymentCreate(BaseModel):
+# Request/response shapes are msgspec Structs decoded by the C decoders
+# below: same constraints as the old pydantic models, a fraction of the
+# per-request validation CPU
+
+class UnifiedPaymentCreate(msgspec.Struct, kw_only=True):
     amount: float  # Amount in dollars
     currency: str = "USD"
-    payment_provider: str = Field(..., pattern="^(stripe|paypal)$")
+    payment_provider: Annotated[str, msgspec.Meta(pattern="^(stripe|paypal)$")]
     service_id: Optional[str] = None
     appointment_id: Optional[str] = None
     training_id: Optional[str] = None
@@ -52,14 +150,17 @@ class UnifiedPaymentCreate(BaseModel):
     return_url: Optional[str] = None
     cancel_url: Optional[str] = None
 
-class UnifiedPaymentResponse(BaseModel):
+class BatchPaymentCreate(msgspec.Struct):
+    items: List[UnifiedPaymentCreate]
+
+class UnifiedPaymentResponse(msgspec.Struct, kw_only=True):
     provider: str
     payment_id: str
     client_secret: Optional[str] = None  # Stripe only
     approval_url: Optional[str] = None   # PayPal only
     status: str
 
-class StripePaymentIntent(BaseModel):
+class StripePaymentIntent(msgspec.Struct, kw_only=True):
     amount: int  # Amount in cents
     currency: str = "usd"
     service_id: Optional[str] = None
@@ -67,7 +168,7 @@ class StripePaymentIntent(BaseModel):
     training_id: Optional[str] = None
     user_id: Optional[str] = None
 
-class PayPalOrder(BaseModel):
+class PayPalOrder(msgspec.Struct, kw_only=True):
     amount: float  # Amount in dollars
     currency: str = "USD"
     service_id: Optional[str] = None
@@ -77,42 +178,100 @@ class PayPalOrder(BaseModel):
     return_url: str
     cancel_url: str
 
+# Module-scope decoders: parse + validate request bodies in one C pass
+_payment_decoder = msgspec.json.Decoder(UnifiedPaymentCreate)
+_batch_decoder = msgspec.json.Decoder(BatchPaymentCreate)
+
+def _json_response(payload) -> Response:
+    """Serialize a msgspec Struct (or containers of them) straight to bytes"""
+    return Response(msgspec.json.encode(payload), media_type="application/json")
+
 # ========================
 # Health & Info Endpoints
 # ========================
 
+# The root body is constant and the full health body only changes when the
+# background refresher updates _HEALTH_CACHE, so serialize them ahead of
+# time and return raw bytes — no pydantic or JSON encoding per request
+_ROOT_BODY = orjson.dumps({
+    "message": "Doula Life Unified Payment API",
+    "status": "running",
+    "providers": ["stripe", "paypal"]
+})
+_HEALTH_SIMPLE_BODY = orjson.dumps({"status": "ok"})
+_HEALTH_BODY_TTL = 10  # seconds; re-serialize at most this often
+_health_body = None
+_health_body_expires = 0.0
+
 @app.get("/")
 async def root():
-    return {"message": "Doula Life Unified Payment API", "status": "running", "providers": ["stripe", "paypal"]}
+    return Response(_ROOT_BODY, media_type="application/json")
+
+# Provider connectivity for the full health response, refreshed by a
+# background task so load-balancer probe traffic never turns into live
+# provider API calls (and can't trip provider rate limits)
+_HEALTH_CACHE = {
+    "stripe": {"status": "unknown"},
+    "paypal": {"status": "unknown"},
+}
+_HEALTH_REFRESH_INTERVAL = 30
+
+async def _health_refresher() -> None:
+    while True:
+        try:
+            stripe_result, paypal_result = await asyncio.gather(_check_stripe(), _check_paypal())
+            _HEALTH_CACHE["stripe"] = stripe_result
+            _HEALTH_CACHE["paypal"] = paypal_result
+        except Exception as e:
+            logger.warning("Health refresh failed: %s", e)
+        await asyncio.sleep(_HEALTH_REFRESH_INTERVAL)
+
+@app.on_event("startup")
+async def _start_health_refresher() -> None:
+    asyncio.create_task(_health_refresher())
 
 @app.get("/health")
-async def health():
-    """Health check endpoint with payment provider status"""
-    stripe_configured = bool(os.getenv("STRIPE_SECRET_KEY"))
-    paypal_configured = bool(os.getenv("PAYPAL_CLIENT_ID") and os.getenv("PAYPAL_CLIENT_SECRET"))
-    
-    return {
-        "status": "healthy",
-        "providers": {
-            "stripe": {
-                "configured": stripe_configured,
-                "ready": stripe_configured
+async def health(simple: bool = False):
+    """Health check endpoint with payment provider status
+
+    ``?simple=true`` is the fast path for load-balancer liveness probes:
+    a bare 200 with no provider lookups. The full response reports
+    connectivity from _HEALTH_CACHE rather than probing live, and its
+    serialized bytes are reused for up to _HEALTH_BODY_TTL seconds.
+    """
+    global _health_body, _health_body_expires
+
+    if simple:
+        return Response(_HEALTH_SIMPLE_BODY, media_type="application/json")
+
+    now = time.monotonic()
+    if _health_body is None or now >= _health_body_expires:
+        _health_body = orjson.dumps({
+            "status": "healthy",
+            "providers": {
+                "stripe": {
+                    "configured": STRIPE_CONFIGURED,
+                    "ready": STRIPE_CONFIGURED,
+                    "connectivity": _HEALTH_CACHE["stripe"]
+                },
+                "paypal": {
+                    "configured": PAYPAL_CONFIGURED,
+                    "mode": PAYPAL_MODE,
+                    "ready": PAYPAL_CONFIGURED,
+                    "connectivity": _HEALTH_CACHE["paypal"]
+                }
             },
-            "paypal": {
-                "configured": paypal_configured,
-                "mode": os.getenv("PAYPAL_MODE", "sandbox"),
-                "ready": paypal_configured
-            }
-        },
-        "environment": os.getenv("ENVIRONMENT", "development")
-    }
+            "environment": ENVIRONMENT
+        })
+        _health_body_expires = now + _HEALTH_BODY_TTL
+    return Response(_health_body, media_type="application/json")
 
 # ========================
 # Unified Payment Interface
 # ========================
 
-@app.post("/payments/create", response_model=UnifiedPaymentResponse)
-async def create_unified_payment(payment_data: UnifiedPaymentCreate):
+@app.post("/payments/create")
+async def create_unified_payment(request: Request):
     """
     Create a payment using either Stripe or PayPal.
     
@@ -134,13 +293,18 @@ async def create_unified_payment(payment_data: UnifiedPaymentCreate):
         "cancel_url": "https://yoursite.com/cancel"
     }
     """
-    logger.info(f"Creating unified payment: {payment_data.payment_provider}, ${payment_data.amount:.2f}")
+    try:
+        payment_data = _payment_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    logger.info("Creating unified payment: %s, $%.2f", payment_data.payment_provider, payment_data.amount)
     
     try:
         if payment_data.payment_provider == "stripe":
-            return await create_stripe_payment(payment_data)
+            return _json_response(await create_stripe_payment(payment_data))
         elif payment_data.payment_provider == "paypal":
-            return await create_paypal_payment(payment_data)
+            return _json_response(await create_paypal_payment(payment_data))
         else:
             raise HTTPException(
                 status_code=400,
@@ -149,57 +313,152 @@ async def create_unified_payment(payment_data: UnifiedPaymentCreate):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in unified payment: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in unified payment: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while processing payment"
         )
 
+async def _create_one_payment(payment_data: UnifiedPaymentCreate):
+    """Create a single payment for the batch endpoint; errors become results"""
+    try:
+        if payment_data.payment_provider == "stripe":
+            return await create_stripe_payment(payment_data)
+        return await create_paypal_payment(payment_data)
+    except HTTPException as e:
+        return {"error": e.detail, "status_code": e.status_code}
+
+@app.post("/payments/batch")
+async def create_batch_payments(request: Request):
+    """
+    Create several payments in one request.
+
+    Items are dispatched concurrently with asyncio.gather (each provider
+    call runs on the threadpool and shares the pooled HTTP connections),
+    so a batch of N costs roughly one round trip of wall-clock instead of
+    N sequential ones. Failures come back per item rather than failing
+    the whole batch.
+    """
+    try:
+        batch = _batch_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    logger.info("Creating batch of %d payments", len(batch.items))
+    results = await asyncio.gather(*(_create_one_payment(item) for item in batch.items))
+    return _json_response({"results": results})
+
 # ========================
 # Stripe Implementation
 # ========================
 
+# Payment-context fields copied into provider metadata, in one place so
+# both providers stay in sync
+_METADATA_FIELDS = ("user_id", "service_id", "appointment_id", "training_id")
+
+# One async HTTP client shared by all outbound Stripe calls on the request
+# path. The sync SDK blocks a threadpool slot per in-flight call (capped at
+# ~40 by the default pool), while httpx keeps every payment round trip on
+# the event loop, so in-flight payments scale with connections, not threads.
+_HTTPX = httpx.AsyncClient(
+    base_url="https://api.stripe.com/v1/",
+    timeout=10,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+)
+
+@app.on_event("shutdown")
+async def _close_httpx() -> None:
+    await _HTTPX.aclose()
+
+async def _stripe_post(path: str, data: dict) -> dict:
+    """POST a form-encoded request to Stripe's REST API, return the JSON body
+
+    Raises HTTPException with Stripe's error message on an API error and
+    503 when Stripe is unreachable.
+    """
+    try:
+        response = await _HTTPX.post(path, data=data, auth=(STRIPE_SECRET_KEY, ""))
+    except httpx.HTTPError as e:
+        logger.error("Stripe request failed: %s", e)
+        raise HTTPException(status_code=503, detail="Payment service temporarily unavailable")
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        # Non-JSON body (proxy error page, truncated response) — treat it
+        # like an unreachable upstream, not a client error
+        logger.error("Non-JSON response from Stripe (status %d)", response.status_code)
+        raise HTTPException(status_code=503, detail="Payment service temporarily unavailable")
+    if response.status_code >= 400:
+        message = body.get("error", {}).get("message", "unknown error")
+        logger.error("Stripe error: %s", message)
+        raise HTTPException(status_code=400, detail=f"Stripe error: {message}")
+    return body
+
 async def create_stripe_payment(payment_data: UnifiedPaymentCreate) -> UnifiedPaymentResponse:
     """Create Stripe payment intent"""
-    if not stripe.api_key:
+    if not STRIPE_CONFIGURED:
         raise HTTPException(status_code=500, detail="Stripe not configured")
-    
-    try:
-        # Convert dollars to cents for Stripe
-        amount_cents = int(payment_data.amount * 100)
-        
-        # Build metadata
-        metadata = {}
-        if payment_data.user_id:
-            metadata["user_id"] = payment_data.user_id
-        if payment_data.service_id:
-            metadata["service_id"] = payment_data.service_id
-        if payment_data.appointment_id:
-            metadata["appointment_id"] = payment_data.appointment_id
-        if payment_data.training_id:
-            metadata["training_id"] = payment_data.training_id
-        
-        # Create payment intent
-        intent = stripe.PaymentIntent.create(
-            amount=amount_cents,
-            currency=payment_data.currency.lower(),
-            metadata=metadata,
-            automatic_payment_methods={'enabled': True},
-            description=f"Doula Life payment - {metadata.get('service_id', 'general')}"
-        )
-        
-        logger.info(f"Created Stripe payment intent: {intent.id}")
-        
-        return UnifiedPaymentResponse(
-            provider="stripe",
-            payment_id=intent.id,
-            client_secret=intent.client_secret,
-            status="requires_payment_method"
-        )
-        
-    except stripe.error.StripeError as e:
-        logger.error(f"Stripe error: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Stripe error: {str(e)}")
+
+    # Convert dollars to cents for Stripe
+    amount_cents = int(payment_data.amount * 100)
+
+    # Build metadata in one pass, dropping unset fields
+    metadata = {
+        k: getattr(payment_data, k)
+        for k in _METADATA_FIELDS
+        if getattr(payment_data, k) is not None
+    }
+
+    # Stripe's API takes form encoding with bracketed nested keys
+    data = {
+        "amount": amount_cents,
+        "currency": payment_data.currency.lower(),
+        "automatic_payment_methods[enabled]": "true",
+        "description": f"Doula Life payment - {metadata.get('service_id', 'general')}",
+    }
+    for key, value in metadata.items():
+        data[f"metadata[{key}]"] = value
+
+    intent = await _stripe_post("payment_intents", data)
+
+    logger.info("Created Stripe payment intent: %s", intent["id"])
+
+    return UnifiedPaymentResponse(
+        provider="stripe",
+        payment_id=intent["id"],
+        client_secret=intent["client_secret"],
+        status="requires_payment_method"
+    )
+
+_STRIPE_SIG_TOLERANCE = 300  # seconds, same default as the Stripe SDK
+
+def _verify_stripe_sig(payload: bytes, sig_header: str, secret: str) -> dict:
+    """Verify a Stripe webhook signature and return the parsed event
+
+    Specialization of stripe.Webhook.construct_event for our fixed shape:
+    one split of the header, one HMAC over the raw bytes, and an orjson
+    parse — no regex pass, no re-encode, no StripeObject wrapping.
+    Raises ValueError on any mismatch.
+    """
+    timestamp = None
+    signatures = []
+    for item in sig_header.split(","):
+        key, _, value = item.partition("=")
+        if key == "t":
+            timestamp = value
+        elif key == "v1":
+            signatures.append(value)
+    if timestamp is None or not signatures:
+        raise ValueError("Malformed stripe-signature header")
+    if abs(time.time() - int(timestamp)) > _STRIPE_SIG_TOLERANCE:
+        raise ValueError("Webhook timestamp outside tolerance")
+
+    expected = hmac.new(
+        secret.encode(), timestamp.encode() + b"." + payload, hashlib.sha256
+    ).hexdigest()
+    if not any(hmac.compare_digest(expected, sig) for sig in signatures):
+        raise ValueError("Webhook signature mismatch")
+    return orjson.loads(payload)
 
 @app.post("/payments/stripe/webhook")
 async def stripe_webhook(request: Request):
@@ -211,34 +470,40 @@ async def stripe_webhook(request: Request):
         raise HTTPException(status_code=400, detail="Missing signature")
     
     try:
-        webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
-        if not webhook_secret:
+        if not STRIPE_WEBHOOK_SECRET:
             raise HTTPException(status_code=500, detail="Webhook secret not configured")
         
-        event = stripe.Webhook.construct_event(payload, sig_header, webhook_secret)
+        event = _verify_stripe_sig(payload, sig_header, STRIPE_WEBHOOK_SECRET)
         
         if event['type'] == 'payment_intent.succeeded':
             payment_intent = event['data']['object']
-            logger.info(f"✅ Stripe payment succeeded: {payment_intent['id']}")
+            logger.info("✅ Stripe payment succeeded: %s", payment_intent['id'])
             # Here you would save to database
             
         elif event['type'] == 'payment_intent.payment_failed':
             payment_intent = event['data']['object']
-            logger.warning(f"❌ Stripe payment failed: {payment_intent['id']}")
+            logger.warning("❌ Stripe payment failed: %s", payment_intent['id'])
         
         return {"status": "success", "event_id": event['id']}
         
     except Exception as e:
-        logger.error(f"Stripe webhook error: {str(e)}")
+        logger.error("Stripe webhook error: %s", e)
         raise HTTPException(status_code=400, detail="Webhook processing failed")
 
 # ========================
 # PayPal Implementation
 # ========================
 
+# Invariant skeleton of every PayPal payment body, built once instead of
+# re-allocating the nested payer dict per request
+_PAYPAL_BASE = {
+    "intent": "sale",
+    "payer": {"payment_method": "paypal"},
+}
+
 async def create_paypal_payment(payment_data: UnifiedPaymentCreate) -> UnifiedPaymentResponse:
     """Create PayPal payment order"""
-    if not os.getenv("PAYPAL_CLIENT_ID"):
+    if not PAYPAL_CONFIGURED:
         raise HTTPException(status_code=500, detail="PayPal not configured")
     
     if not payment_data.return_url or not payment_data.cancel_url:
@@ -247,20 +512,18 @@ async def create_paypal_payment(payment_data: UnifiedPaymentCreate) -> UnifiedPa
             detail="PayPal payments require return_url and cancel_url"
         )
     
+    paypalrestsdk = _get_paypal()
     try:
-        # Build custom data
+        # Build custom data in one pass, dropping unset fields
         custom_data = {
-            "user_id": payment_data.user_id,
-            "service_id": payment_data.service_id,
-            "appointment_id": payment_data.appointment_id,
-            "training_id": payment_data.training_id,
+            k: getattr(payment_data, k)
+            for k in _METADATA_FIELDS
+            if getattr(payment_data, k) is not None
         }
-        custom_data = {k: v for k, v in custom_data.items() if v is not None}
         
         # Create PayPal payment
         payment = paypalrestsdk.Payment({
-            "intent": "sale",
-            "payer": {"payment_method": "paypal"},
+            **_PAYPAL_BASE,
             "redirect_urls": {
                 "return_url": payment_data.return_url,
                 "cancel_url": payment_data.cancel_url
@@ -284,18 +547,16 @@ async def create_paypal_payment(payment_data: UnifiedPaymentCreate) -> UnifiedPa
             }]
         })
         
-        if payment.create():
+        if await asyncio.to_thread(payment.create):
             # Find approval URL
-            approval_url = None
-            for link in payment.links:
-                if link.rel == "approval_url":
-                    approval_url = link.href
-                    break
-            
+            approval_url = next(
+                (link.href for link in payment.links if link.rel == "approval_url"), None
+            )
+
             if not approval_url:
                 raise HTTPException(status_code=500, detail="PayPal approval URL not found")
             
-            logger.info(f"Created PayPal payment: {payment.id}")
+            logger.info("Created PayPal payment: %s", payment.id)
             
             return UnifiedPaymentResponse(
                 provider="paypal",
@@ -309,22 +570,22 @@ async def create_paypal_payment(payment_data: UnifiedPaymentCreate) -> UnifiedPa
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"PayPal error: {str(e)}")
+        logger.error("PayPal error: %s", e)
         raise HTTPException(status_code=500, detail="PayPal payment creation failed")
 
 @app.post("/payments/paypal/capture/{payment_id}")
 async def capture_paypal_payment(payment_id: str, payer_id: str):
     """Capture PayPal payment after approval"""
-    logger.info(f"Capturing PayPal payment: {payment_id}")
+    logger.info("Capturing PayPal payment: %s", payment_id)
     
     try:
-        payment = paypalrestsdk.Payment.find(payment_id)
+        payment = _get_paypal().Payment.find(payment_id)
         
         if not payment:
             raise HTTPException(status_code=404, detail="Payment not found")
         
         if payment.execute({"payer_id": payer_id}):
-            logger.info(f"✅ PayPal payment captured: {payment.id}")
+            logger.info("✅ PayPal payment captured: %s", payment.id)
             
             transaction = payment.transactions[0]
             return {
@@ -341,9 +602,50 @@ async def capture_paypal_payment(payment_id: str, payer_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"PayPal capture error: {str(e)}")
+        logger.error("PayPal capture error: %s", e)
         raise HTTPException(status_code=500, detail="Payment capture failed")
 
+# Verifying webhooks through PayPal's verify-webhook-signature API would
+# add a network round trip per event; instead cache PayPal's signing certs
+# and check the RSA signature locally — a ~1ms CPU verify after warmup
+@functools.lru_cache(maxsize=16)
+def _load_paypal_cert(cert_url: str):
+    """Fetch and parse PayPal's webhook signing cert, cached per URL"""
+    from cryptography import x509
+
+    hostname = urlparse(cert_url).hostname or ""
+    if not (hostname == "paypal.com" or hostname.endswith(".paypal.com")):
+        raise ValueError(f"Refusing cert from non-PayPal host: {hostname}")
+    response = _PAYPAL_SESSION.get(cert_url, timeout=10)
+    response.raise_for_status()
+    return x509.load_pem_x509_certificate(response.content)
+
+def _verify_paypal_signature(headers, payload: bytes) -> bool:
+    """Verify a PayPal webhook against the cached signing cert; never raises"""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
+
+    transmission_id = headers.get("paypal-transmission-id")
+    timestamp = headers.get("paypal-transmission-time")
+    cert_url = headers.get("paypal-cert-url")
+    signature = headers.get("paypal-transmission-sig")
+    if not all((transmission_id, timestamp, cert_url, signature)):
+        logger.warning("PayPal webhook missing transmission headers")
+        return False
+
+    # Per PayPal's spec the signed string is
+    # transmissionId|timestamp|webhookId|crc32(body)
+    expected = f"{transmission_id}|{timestamp}|{PAYPAL_WEBHOOK_ID}|{zlib.crc32(payload)}"
+    try:
+        cert = _load_paypal_cert(cert_url)
+        cert.public_key().verify(
+            base64.b64decode(signature), expected.encode(), PKCS1v15(), hashes.SHA256()
+        )
+        return True
+    except Exception as e:
+        logger.warning("PayPal webhook signature verification failed: %s", e)
+        return False
+
 @app.post("/payments/paypal/webhook")
 async def paypal_webhook(request: Request):
     """
@@ -360,12 +662,21 @@ async def paypal_webhook(request: Request):
         if not payload:
             logger.error("Empty PayPal webhook payload")
             raise HTTPException(status_code=400, detail="Empty webhook payload")
-        
-        # Parse JSON payload
+
+        if PAYPAL_WEBHOOK_ID:
+            # Threadpool, not the loop: a cert-cache miss inside the
+            # verifier does a blocking HTTPS fetch
+            if not await asyncio.to_thread(_verify_paypal_signature, request.headers, payload):
+                raise HTTPException(status_code=400, detail="Invalid webhook signature")
+        else:
+            logger.warning("PAYPAL_WEBHOOK_ID not set; skipping webhook signature verification")
+
+        # Parse JSON payload; orjson takes the raw bytes directly, so no
+        # intermediate str is built
         try:
-            event_data = json.loads(payload.decode('utf-8'))
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            logger.error(f"Invalid JSON in PayPal webhook payload: {str(e)}")
+            event_data = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON in PayPal webhook payload: %s", e)
             raise HTTPException(status_code=400, detail="Invalid webhook payload format")
         
         # Extract event information
@@ -376,7 +687,7 @@ async def paypal_webhook(request: Request):
             logger.error("PayPal webhook missing event_type")
             raise HTTPException(status_code=400, detail="Invalid webhook event format")
         
-        logger.info(f"Processing PayPal webhook event: {event_type} (ID: {event_id})")
+        logger.info("Processing PayPal webhook event: %s (ID: %s)", event_type, event_id)
         
         # Handle different event types
         if event_type == 'PAYMENT.SALE.COMPLETED':
@@ -385,83 +696,115 @@ async def paypal_webhook(request: Request):
             sale_id = resource.get('id')
             amount = resource.get('amount', {})
             
-            logger.info(f"PayPal sale completed: {sale_id} for payment: {payment_id}")
-            logger.info(f"Amount: {amount.get('total', '0.00')} {amount.get('currency', 'USD')}")
+            logger.info("PayPal sale completed: %s for payment: %s", sale_id, payment_id)
+            logger.info("Amount: %s %s", amount.get('total', '0.00'), amount.get('currency', 'USD'))
             
         elif event_type == 'PAYMENT.SALE.DENIED':
             resource = event_data.get('resource', {})
             sale_id = resource.get('id')
-            logger.warning(f"PayPal sale denied: {sale_id}")
+            logger.warning("PayPal sale denied: %s", sale_id)
             
         elif event_type == 'PAYMENT.SALE.REFUNDED':
             resource = event_data.get('resource', {})
             refund_id = resource.get('id')
             amount = resource.get('amount', {})
-            logger.info(f"PayPal refund: {refund_id}, Amount: {amount.get('total', '0.00')}")
+            logger.info("PayPal refund: %s, Amount: %s", refund_id, amount.get('total', '0.00'))
             
         else:
-            logger.info(f"Unhandled PayPal webhook event: {event_type}")
+            logger.info("Unhandled PayPal webhook event: %s", event_type)
         
         return {"status": "success", "event_id": event_id, "event_type": event_type}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"PayPal webhook processing error: {str(e)}")
+        logger.error("PayPal webhook processing error: %s", e)
         raise HTTPException(status_code=500, detail="Error processing webhook event")
 
 # ========================
 # Test & Utility Endpoints
 # ========================
 
+@functools.lru_cache(maxsize=1)
+def _cached_stripe_account(_bucket: int):
+    return _get_stripe().Account.retrieve()
+
+def _get_stripe_account():
+    """Stripe account for the configured key, cached with a 60s TTL
+
+    The account never changes for the lifetime of the process, so repeated
+    health/test probes reuse the cached object instead of spending an API
+    call (and Stripe rate-limit budget); the time bucket rolls the cache
+    over every 60s.
+    """
+    return _cached_stripe_account(int(time.time()) // 60)
+
+async def _check_stripe():
+    """Probe Stripe connectivity; never raises, reports errors as a status"""
+    if not STRIPE_CONFIGURED:
+        return {"status": "not_configured"}
+    try:
+        account = await asyncio.to_thread(_get_stripe_account)
+        return {
+            "status": "connected",
+            "account_id": account.id,
+            "country": account.country
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+async def _check_paypal():
+    """Probe PayPal configuration; never raises, reports errors as a status"""
+    if not PAYPAL_CONFIGURED:
+        return {"status": "not_configured"}
+    try:
+        # Test by creating a minimal payment (not executed)
+        test_payment = _get_paypal().Payment({
+            **_PAYPAL_BASE,
+            "redirect_urls": {
+                "return_url": "http://test.com/return",
+                "cancel_url": "http://test.com/cancel"
+            },
+            "transactions": [{
+                "amount": {"total": "1.00", "currency": "USD"},
+                "description": "Test payment"
+            }]
+        })
+
+        # Don't actually create, just test configuration
+        return {
+            "status": "configured",
+            "mode": PAYPAL_MODE
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
 @app.post("/payments/test")
 async def test_payment_providers():
-    """Test both payment providers"""
-    results = {"stripe": None, "paypal": None}
-    
-    # Test Stripe
-    if stripe.api_key:
-        try:
-            account = stripe.Account.retrieve()
-            results["stripe"] = {
-                "status": "connected",
-                "account_id": account.id,
-                "country": account.country
-            }
-        except Exception as e:
-            results["stripe"] = {"status": "error", "message": str(e)}
-    else:
-        results["stripe"] = {"status": "not_configured"}
-    
-    # Test PayPal
-    if os.getenv("PAYPAL_CLIENT_ID"):
-        try:
-            # Test by creating a minimal payment (not executed)
-            test_payment = paypalrestsdk.Payment({
-                "intent": "sale",
-                "payer": {"payment_method": "paypal"},
-                "redirect_urls": {
-                    "return_url": "http://test.com/return",
-                    "cancel_url": "http://test.com/cancel"
-                },
-                "transactions": [{
-                    "amount": {"total": "1.00", "currency": "USD"},
-                    "description": "Test payment"
-                }]
-            })
-            
-            # Don't actually create, just test configuration
-            results["paypal"] = {
-                "status": "configured",
-                "mode": os.getenv("PAYPAL_MODE", "sandbox")
-            }
-        except Exception as e:
-            results["paypal"] = {"status": "error", "message": str(e)}
-    else:
-        results["paypal"] = {"status": "not_configured"}
-    
-    return results
+    """Test both payment providers concurrently
+
+    The Stripe and PayPal probes are independent network round trips, so
+    running them with asyncio.gather costs max() of the two latencies
+    instead of their sum.
+    """
+    stripe_result, paypal_result = await asyncio.gather(_check_stripe(), _check_paypal())
+    return {"stripe": stripe_result, "paypal": paypal_result}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002, reload=True)
\ No newline at end of file
+    # uvloop + httptools replace the pure-Python event loop and HTTP parser
+    # with C implementations (pulled in via uvicorn[standard])
+    if ENVIRONMENT == "production":
+        # reload=True pins uvicorn to a single process; in production scale
+        # across cores instead (app passed as an import string so each
+        # worker builds its own instance)
+        uvicorn.run(
+            "unified_payments_app:app",
+            host="0.0.0.0",
+            port=8002,
+            workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+            loop="uvloop",
+            http="httptools",
+        )
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8002, reload=True, loop="uvloop", http="httptools")
\ No newline at end of file